@@ -1,71 +1,109 @@
 #!/usr/bin/env python3
 import pdfplumber
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Header cells that show up in the Presenter column
+_SKIP = frozenset({'presenter', 'time', 'role', 'event', 'starting at:', 'theme: our super'})
+
+def _is_presenter(cell: str) -> bool:
+    # Skip empty entries, headers and times/durations
+    if not cell or cell.lower() in _SKIP:
+        return False
+    # Times or durations such as "7:30" or "1.5"
+    return not cell.replace(':', '').replace('.', '').isdigit()
+
+# Below this many pages, worker start-up costs more than it saves
+_PARALLEL_MIN_PAGES = 20
+
+def _process_page(page, page_number):
+    presenters = []
+    log = [f"Processing page {page_number}..."]
+    
+    # Try to extract tables first
+    tables = page.extract_tables()
+    
+    if tables:
+        for table_num, table in enumerate(tables):
+            log.append(f"  Found table {table_num + 1} with {len(table)} rows")
+            
+            for row_num, row in enumerate(table):
+                if row and len(row) >= 3:
+                    # Clean up the third column (Presenter)
+                    presenter = row[2].strip() if row[2] else ""
+                    
+                    if not _is_presenter(presenter):
+                        continue
+                    
+                    presenters.append((presenter, page_number, row_num + 1))
+                    log.append(f"    Found presenter: {presenter}")
+    
+    # If no tables found, try to extract text and parse manually
+    if not tables:
+        text = page.extract_text()
+        if text:
+            log.append(f"  No tables found, extracting text manually...")
+            lines = text.split('\n')
+            
+            for line_num, line in enumerate(lines):
+                # Split on multiple spaces to find columns
+                parts = line.split('  ')
+                parts = [p.strip() for p in parts if p.strip()]
+                
+                if len(parts) >= 3:
+                    presenter = parts[2]
+                    if not _is_presenter(presenter):
+                        continue
+                    
+                    presenters.append((presenter, page_number, line_num + 1))
+                    log.append(f"    Found presenter: {presenter}")
+    
+    return presenters, log
+
+def _process_page_in_worker(args):
+    pdf_path, page_number = args
+    
+    # Each worker opens only its own page so pdfplumber's caches stay per-process
+    with pdfplumber.open(pdf_path, pages=[page_number]) as pdf:
+        return _process_page(pdf.pages[0], page_number)
+
+def _collect(presenters, results):
+    # Progress lines are printed here, in page order, rather than by the workers
+    for page_presenters, log in results:
+        for line in log:
+            print(line)
+        presenters.extend(page_presenters)
 
 def extract_presenters_from_pdf(pdf_path):
     presenters = []
     
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                print(f"Processing page {page_num + 1}...")
-                
-                # Try to extract tables first
-                tables = page.extract_tables()
-                
-                if tables:
-                    for table_num, table in enumerate(tables):
-                        print(f"  Found table {table_num + 1} with {len(table)} rows")
-                        
-                        for row_num, row in enumerate(table):
-                            if row and len(row) >= 3:
-                                # Clean up the third column (Presenter)
-                                presenter = row[2].strip() if row[2] else ""
-                                
-                                # Skip empty entries and headers
-                                if presenter and presenter.lower() not in ['presenter', 'time', 'role', 'event']:
-                                    # Skip entries that look like times or durations
-                                    if not presenter.replace(':', '').replace('.', '').isdigit():
-                                        # Skip specific header entries
-                                        if presenter.lower() not in ['starting at:', 'theme: our super']:
-                                            presenters.append({
-                                                'presenter': presenter,
-                                                'page': page_num + 1,
-                                                'row': row_num + 1
-                                            })
-                                            print(f"    Found presenter: {presenter}")
-                
-                # If no tables found, try to extract text and parse manually
-                if not tables:
-                    text = page.extract_text()
-                    if text:
-                        print(f"  No tables found, extracting text manually...")
-                        lines = text.split('\n')
-                        
-                        for line_num, line in enumerate(lines):
-                            # Split on multiple spaces to find columns
-                            parts = line.split('  ')
-                            parts = [p.strip() for p in parts if p.strip()]
-                            
-                            if len(parts) >= 3:
-                                presenter = parts[2]
-                                if presenter and presenter.lower() not in ['presenter', 'time', 'role', 'event']:
-                                    if not presenter.replace(':', '').replace('.', '').isdigit():
-                                        # Skip specific header entries
-                                        if presenter.lower() not in ['starting at:', 'theme: our super']:
-                                            presenters.append({
-                                                'presenter': presenter,
-                                                'page': page_num + 1,
-                                                'row': line_num + 1
-                                            })
-                                            print(f"    Found presenter: {presenter}")
+            num_pages = len(pdf.pages)
+            
+            if num_pages < _PARALLEL_MIN_PAGES:
+                for page_number, page in enumerate(pdf.pages, start=1):
+                    _collect(presenters, [_process_page(page, page_number)])
+                    # Release pdfplumber's cached layout objects for this page
+                    page.close()
+        
+        if num_pages >= _PARALLEL_MIN_PAGES:
+            # Pages are independent, so parse them in parallel and keep page order
+            max_workers = min(num_pages, os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                jobs = [(pdf_path, page_number) for page_number in range(1, num_pages + 1)]
+                _collect(presenters, executor.map(_process_page_in_worker, jobs))
     
     except Exception as e:
         print(f"Error processing PDF: {e}")
         return []
     
-    return presenters
+    return [
+        {'presenter': presenter, 'page': page, 'row': row}
+        for presenter, page, row in presenters
+    ]
 
 def main():
     pdf_file = "Spa Speaker Agenda - President handover (1).pdf"